@@ -111,9 +111,11 @@ def generate_namespace(event: str, actions: list[str]) -> str:
 
 
 def generate_namespaces() -> str:
-    attrs = [BASE_CLASS]
+    events_and_actions = collect_events_and_actions()
+    event_names = indent_lines(events_and_actions, '"{}",', 4)
+    attrs = [BASE_CLASS.format(event_names=event_names)]
     namespaces: list[str] = []
-    for event, actions in collect_events_and_actions().items():
+    for event, actions in events_and_actions.items():
         attr = ATTR_TEMPLATE.format(event=event, event_pascal=snake_to_pascal(event))
         attrs.append(attr)
         namespace = generate_namespace(event, actions)
@@ -31,6 +31,7 @@ from ._errors import (
     AuthIssue,
     AuthIssueKind,
     Error,
+    EventPayload,
     MonalistenPreprocessingError,
     MonalistenSetupError,
 )
@@ -39,6 +40,7 @@ __all__ = (
     "AuthIssue",
     "AuthIssueKind",
     "Error",
+    "EventPayload",
     "Monalisten",
     "MonalistenPreprocessingError",
     "MonalistenSetupError",
@@ -1,26 +1,34 @@
 from __future__ import annotations
 
 import asyncio
-from itertools import chain
+import hashlib
+import hmac
+import json
+import re
+from functools import cache, partial
+from importlib.util import find_spec
 from typing import TYPE_CHECKING, Any, cast, final
 
 import httpx
-from githubkit import webhooks
+from githubkit.compat import PYDANTIC_V2, type_validate_python
 from pydantic import ValidationError
 
+from monalisten import events
 from monalisten._errors import (
     AuthIssue,
     AuthIssueKind,
     Error,
     MonalistenPreprocessingError,
+    MonalistenSetupError,
 )
-from monalisten._event_namespace import EventNamespace
-from monalisten._namespace import InternalNamespace
+from monalisten._event_namespace import EVENT_NAMES, EventNamespace
+from monalisten._namespace import HookNamespace, InternalNamespace
 from monalisten._sse import aiter_sse_retrying
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Sequence
 
+    from httpx_sse import ServerSentEvent
     from typing_extensions import ParamSpec
 
     from monalisten._errors import EventPayload
@@ -31,19 +39,99 @@ if TYPE_CHECKING:
 EVENT_HEADER = "x-github-event"
 SIG_HEADER = "x-hub-signature-256"
 
+_MSG_MISSING_EVENT_HEADER = f"received data is missing the {EVENT_HEADER} header"
+_MSG_MISSING_BODY = "received data doesn't contain a body"
+_MSG_UNPARSABLE_EVENT = "the received payload could not be parsed as an event"
+
+# HTTP/2 support in httpx requires the optional `h2` package
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# GitHub sends exactly 64 lowercase hex digits, which bytes.fromhex alone doesn't check
+_HEX_DIGEST_RE = re.compile("[0-9a-f]{64}")
+
+# Matches the body normalization done by githubkit's webhooks.sign/verify
+_encode_body = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _lowercase_keys(data: dict[str, Any]) -> dict[str, Any]:
+    # Relays tend to send header names lowercased already, so only rename the keys
+    # that need it instead of rebuilding the whole mapping for every event
+    for key in [k for k in data if not k.islower()]:
+        data[key.lower()] = data.pop(key)
+    return data
+
+
+@cache
+def _event_validator(event_name: str) -> Callable[[Any], events.Any]:
+    event_type = getattr(
+        events, "".join(word.capitalize() for word in event_name.split("_"))
+    )
+    if not PYDANTIC_V2:
+        return partial(type_validate_python, event_type)
+    # githubkit's parse_obj builds a new TypeAdapter (and thus a new core schema) on
+    # every call, so keep one per event type around instead
+    from pydantic import TypeAdapter  # noqa: PLC0415 (missing in pydantic v1)
+
+    return TypeAdapter(event_type).validate_python
+
+
+def _verify_signature(
+    hmac_template: hmac.HMAC, body: dict[str, Any], signature: str
+) -> bool:
+    # Comparing raw digests skips hex-encoding the computed one on every event
+    method, _, hex_digest = signature.partition("=")
+    if method != "sha256" or not _HEX_DIGEST_RE.fullmatch(hex_digest):
+        return False
+    mac = hmac_template.copy()
+    mac.update(_encode_body(body).encode())
+    return hmac.compare_digest(mac.digest(), bytes.fromhex(hex_digest))
+
 
 @final
 class Monalisten:
     """
     A Monalisten client streaming events from `source`, optionally secured by the secret
-    `token`.
+    `token`. Up to `concurrency` events are handled at the same time. Events are
+    streamed with `http_client` if given, or with an internal HTTP client otherwise.
     """
 
-    def __init__(self, source: str, *, token: str | None = None) -> None:
+    def __init__(
+        self,
+        source: str,
+        *,
+        token: str | None = None,
+        concurrency: int = 1,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        if concurrency < 1:
+            msg = f"concurrency must be at least 1, got {concurrency}"
+            raise MonalistenSetupError(msg)
         self._source = source
         self._token = token
+        self._concurrency = concurrency
+        self._http_client = http_client
+        # Keyed once so that verifying a signature only has to copy the HMAC state
+        self._hmac = (
+            hmac.new(token.encode(), digestmod=hashlib.sha256) if token else None
+        )
+        # The token is fixed for the client's lifetime, so pick the auth check once
+        # instead of branching on it for every event
+        self._passes_auth = (
+            self._passes_unsigned_auth
+            if self._hmac is None
+            else self._passes_signed_auth
+        )
         self._event = EventNamespace()
         self._internal = InternalNamespace()
+        # Registering appends to these lists in place, so binding them once keeps them
+        # current while sparing the namespace lookups for every event
+        self._auth_issue_hooks = self._internal["auth_issue"]
+        self._error_hooks = self._internal["error"]
+        self._payload_hooks = self._internal["payload"]
+        # Keyed by event name, then by action; preallocated since all names are known
+        self._hook_cache: dict[
+            str, dict[str | None, tuple[int, tuple[Hook[[events.Any]], ...]]]
+        ] = {name: {} for name in EVENT_NAMES}
 
     @property
     def event(self) -> EventNamespace:
@@ -61,17 +149,26 @@ class Monalisten:
     def token(self) -> str | None:
         return self._token
 
-    async def _passes_auth(self, payload: EventPayload) -> bool:
-        if not self._token:
-            if SIG_HEADER in payload:
-                await self._report_auth_issue(AuthIssueKind.UNEXPECTED, payload)
-            return True
+    @property
+    def concurrency(self) -> int:
+        return self._concurrency
+
+    @property
+    def http_client(self) -> httpx.AsyncClient | None:
+        return self._http_client
 
+    async def _passes_unsigned_auth(self, payload: EventPayload) -> bool:
+        if SIG_HEADER in payload:
+            await self._report_auth_issue(AuthIssueKind.UNEXPECTED, payload)
+        return True
+
+    async def _passes_signed_auth(self, payload: EventPayload) -> bool:
         if not (signature := payload.get(SIG_HEADER)):
             await self._report_auth_issue(AuthIssueKind.MISSING, payload)
             return False
 
-        if webhooks.verify(self._token, payload["body"], signature):
+        hmac_template = cast("hmac.HMAC", self._hmac)
+        if _verify_signature(hmac_template, payload["body"], signature):
             return True
 
         await self._report_auth_issue(AuthIssueKind.MISMATCH, payload)
@@ -83,7 +180,7 @@ class Monalisten:
         await self._dispatch_hooks(
             payload,
             "auth_issue",
-            self.internal["auth_issue"],
+            self._auth_issue_hooks,
             AuthIssue(issue_kind, payload),
         )
 
@@ -95,56 +192,149 @@ class Monalisten:
     ) -> None:
         if payload:
             event_name = event_name or payload.get(EVENT_HEADER)
-        if not (error_hooks := self.internal["error"]):
+        if not self._error_hooks:
             raise exc
         await self._dispatch_hooks(
-            payload, event_name, error_hooks, Error(exc, event_name, payload)
+            payload, event_name, self._error_hooks, Error(exc, event_name, payload)
         )
 
     async def _handle_payload(
         self, payload: EventPayload, *, skip_auth: bool = False
     ) -> None:
         if not (event_name := payload.get(EVENT_HEADER)):
-            msg = f"received data is missing the {EVENT_HEADER} header"
-            await self._raise(MonalistenPreprocessingError(msg), payload)
+            exc = MonalistenPreprocessingError(_MSG_MISSING_EVENT_HEADER)
+            await self._raise(exc, payload)
             return
 
         if not (body := payload.get("body")):
-            msg = "received data doesn't contain a body"
-            await self._raise(MonalistenPreprocessingError(msg), payload, event_name)
+            exc = MonalistenPreprocessingError(_MSG_MISSING_BODY)
+            await self._raise(exc, payload, event_name)
             return
 
         if not (skip_auth or await self._passes_auth(payload)):
             return
 
-        hook_kinds = [self.event.any["*"], self.event[event_name]["*"]]
-        if action := body.get("action"):
-            hook_kinds.append(self.event[event_name][action])
+        if self._payload_hooks:
+            # Raw payload hooks don't need the body to be parsed
+            await self._dispatch_hooks(
+                payload, event_name, self._payload_hooks, payload
+            )
+
+        if event_name not in EVENT_NAMES:
+            # Only hooks for all events could be owed this event; raw payload hooks
+            # have already handled it without needing the event to be known
+            if self.event.any["*"]:
+                msg = f"received an unknown event: {event_name!r}"
+                exc = MonalistenPreprocessingError(msg)
+                await self._raise(exc, payload, event_name)
+            return
 
-        if not (hooks := list(chain.from_iterable(hook_kinds))):
+        if not (hooks := self._get_event_hooks(event_name, body.get("action"))):
             # Don't parse an event if nothing will handle it anyway
             return
 
         try:
-            webhook_event = webhooks.parse_obj(event_name, body)
+            # The relay has already decoded the body, and validating that dict is
+            # cheaper than re-validating the bytes serialized for the signature check
+            webhook_event = _event_validator(event_name)(body)
         except ValidationError as pydantic_exc:
-            msg = "the received payload could not be parsed as an event"
-            exc = MonalistenPreprocessingError(msg)
+            exc = MonalistenPreprocessingError(_MSG_UNPARSABLE_EVENT)
             exc.__cause__ = pydantic_exc
             await self._raise(exc, payload, event_name)
             return
 
         await self._dispatch_hooks(payload, event_name, hooks, webhook_event)
 
+    def _get_event_hooks(
+        self, event_name: str, action: str | None
+    ) -> tuple[Hook[[events.Any]], ...]:
+        # Hooks are almost always registered before streaming starts, so flatten the
+        # hooks for each trigger once and only redo it after a new registration
+        current_version = HookNamespace._version  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        action_cache = self._hook_cache[event_name]
+        version, hooks = action_cache.get(action, (-1, ()))
+        if version == current_version:
+            return hooks
+
+        namespace = self.event[event_name]
+        action_hooks = namespace[action] if action else ()  # pyright: ignore[reportArgumentType]
+        hooks = (*self.event.any["*"], *namespace["*"], *action_hooks)
+        action_cache[action] = (current_version, hooks)
+        return hooks
+
     async def listen(self) -> None:
-        """Start an internal HTTP client and stream events from `source`."""
-        async with httpx.AsyncClient(timeout=None) as client:
-            await self._dispatch_hooks(
-                None, "ready", cast("list[Hook[[]]]", self.internal["ready"])
-            )
+        """
+        Stream events from `source`, using an internal HTTP client unless one was
+        given to the constructor.
+        """
+        if self._http_client is not None:
+            # The caller owns the client, so leave opening and closing it to them
+            await self._listen(self._http_client)
+            return
+        async with httpx.AsyncClient(timeout=None, http2=_HTTP2_AVAILABLE) as client:
+            await self._listen(client)
+
+    async def _listen(self, client: httpx.AsyncClient) -> None:
+        await self._dispatch_hooks(
+            None, "ready", cast("list[Hook[[]]]", self.internal["ready"])
+        )
+        # The bounded queue makes the stream wait for workers when they fall
+        # behind, and lets reading the next event overlap with handling this one
+        queue: asyncio.Queue[ServerSentEvent | None] = asyncio.Queue(self._concurrency)
+        stream_task = asyncio.create_task(self._stream_events(client, queue))
+        tasks = [
+            stream_task,
+            *(
+                asyncio.create_task(self._process_events(queue))
+                for _ in range(self._concurrency)
+            ),
+        ]
+        pending = set(tasks)
+        failed_task: asyncio.Task[None] | None = None
+        try:
+            while pending and failed_task is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    # A failed stream still lets the workers finish the events it
+                    # already read, but anything cancelled or a failed worker
+                    # (which would leave the stream blocked on the queue) stops all
+                    if task.cancelled() or (
+                        task is not stream_task and task.exception()
+                    ):
+                        failed_task = task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        (failed_task or stream_task).result()
+
+    async def _stream_events(
+        self,
+        client: httpx.AsyncClient,
+        queue: asyncio.Queue[ServerSentEvent | None],
+    ) -> None:
+        try:
             async for event in aiter_sse_retrying(client, "GET", self._source):
-                if payload := {k.casefold(): v for k, v in event.json().items()}:
-                    await self._handle_payload(cast("EventPayload", payload))
+                await queue.put(event)
+        except Exception:
+            # Let the workers finish the events that were already read first
+            await self._stop_workers(queue)
+            raise
+        await self._stop_workers(queue)
+
+    async def _stop_workers(self, queue: asyncio.Queue[ServerSentEvent | None]) -> None:
+        for _ in range(self._concurrency):
+            await queue.put(None)
+
+    async def _process_events(
+        self, queue: asyncio.Queue[ServerSentEvent | None]
+    ) -> None:
+        while (event := await queue.get()) is not None:
+            # Frames without data (e.g. relay keep-alives) have nothing to decode
+            if event.data and (payload := _lowercase_keys(event.json())):
+                await self._handle_payload(cast("EventPayload", payload))
 
     async def dispatch_event(
         self,
@@ -159,9 +349,11 @@ class Monalisten:
         Useful for testing hooks without a real GitHub webhook or SSE relay.
         Authentication is skipped by default; set a signature header to test it.
         """
-        payload = {EVENT_HEADER: event_type, "body": body} | {
-            k.casefold(): v for k, v in (headers or {}).items()
-        }
+        payload = _lowercase_keys({
+            EVENT_HEADER: event_type,
+            "body": body,
+            **(headers or {}),
+        })
         await self._handle_payload(
             cast("EventPayload", payload), skip_auth=SIG_HEADER not in payload
         )
@@ -170,15 +362,24 @@ class Monalisten:
         self,
         payload: EventPayload | None,
         event_name: str | None,
-        hooks: Iterable[Hook[P]] | None,
+        hooks: Sequence[Hook[P]] | None,
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> None:
-        if hooks is None:
+        if not hooks:
+            return
+        if len(hooks) == 1:
+            # Most triggers have a single hook; gathering it would only add overhead
+            try:
+                await hooks[0](*args, **kwargs)
+            except Exception as exc:  # noqa: BLE001
+                await self._raise(exc, payload, event_name)
             return
         coros = (h(*args, **kwargs) for h in hooks)
         excs = await asyncio.gather(*coros, return_exceptions=True)
-        for exc in filter(None, excs):
+        for exc in excs:
+            if exc is None:
+                continue
             if not isinstance(exc, Exception):
                 # Don't handle non-Exceptions (like SystemExit or KeyboardInterrupt)
                 raise exc
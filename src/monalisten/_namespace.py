@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Generic,
     Literal,
     NoReturn,
@@ -20,12 +21,12 @@ if TYPE_CHECKING:
 
     from typing_extensions import Self
 
-    from monalisten._errors import AuthIssue
+    from monalisten._errors import AuthIssue, EventPayload
 
 E = TypeVar("E")
 L = TypeVar("L", bound=str)
 P = ParamSpec("P")
-InternalEventName = Literal["ready", "auth_issue", "error"]
+InternalEventName = Literal["ready", "auth_issue", "error", "payload"]
 Hook: TypeAlias = "Callable[P, Awaitable[None]]"
 HookWrapper: TypeAlias = "Callable[[Hook[P]], Hook[P]]"
 
@@ -34,8 +35,7 @@ def build_registrar(name: str) -> HookWrapper[...]:
     @property
     def prop(self: HookNamespace[Any, E]) -> Callable[[Hook[[E]]], Hook[[E]]]:
         def wrapper(hook: Hook[[E]]) -> Hook[[E]]:
-            self._paths[name].append(hook)  # pyright: ignore[reportPrivateUsage]
-            return hook
+            return self._register(name, hook)  # pyright: ignore[reportPrivateUsage]
 
         return wrapper
 
@@ -43,6 +43,9 @@ def build_registrar(name: str) -> HookWrapper[...]:
 
 
 class HookNamespace(Generic[L, E]):
+    # Incremented on every hook registration, in any namespace
+    _version: ClassVar[int] = 0
+
     def __init_subclass__(cls) -> None:
         super().__init_subclass__()
         actions = [cast("L", entry) for entry in dir(cls) if not entry.startswith("_")]
@@ -58,7 +61,11 @@ class HookNamespace(Generic[L, E]):
         self._event_hooks: list[Hook[[E]]] = []
 
     def __call__(self, hook: Hook[[E]]) -> Hook[[E]]:
-        self._event_hooks.append(hook)
+        return self._register("*", hook)
+
+    def _register(self, name: L | Literal["*"], hook: Hook[[E]]) -> Hook[[E]]:
+        self[name].append(hook)
+        HookNamespace._version += 1
         return hook
 
     def __getitem__(self, name: L | Literal["*"]) -> list[Hook[[E]]]:
@@ -72,6 +79,7 @@ class InternalNamespace(HookNamespace[InternalEventName, object]):
     ready: HookWrapper[[]] = build_registrar("ready")
     auth_issue: HookWrapper[[AuthIssue]] = build_registrar("auth_issue")
     error: HookWrapper[[Error]] = build_registrar("error")
+    payload: HookWrapper[[EventPayload]] = build_registrar("payload")
 
     def __call__(self, _: object) -> NoReturn:
         msg = (
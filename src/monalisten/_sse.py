@@ -17,10 +17,20 @@ async def aiter_sse_retrying(
 ) -> AsyncIterator[ServerSentEvent]:
     last_event_id: str | None = None
     retry_delay = 0.0
+    # Streams can stay idle for a long time, so only the read timeout is lifted while
+    # keeping the client's other timeouts
+    timeout = httpx.Timeout(
+        connect=client.timeout.connect,
+        read=None,
+        write=client.timeout.write,
+        pool=client.timeout.pool,
+    )
     for attempt in count():
         try:
             headers = {"Last-Event-ID": last_event_id} if last_event_id else {}
-            async with aconnect_sse(client, method, url, headers=headers) as stream:
+            async with aconnect_sse(
+                client, method, url, headers=headers, timeout=timeout
+            ) as stream:
                 async for sse in stream.aiter_sse():
                     last_event_id = sse.id
                     retry_delay = (sse.retry or 0) / 1000
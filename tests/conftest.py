@@ -1,22 +1,36 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 import pytest
 
-from .sse_server import QUEUE_KEY, ServerQueue, start_test_server
+from .sse_server import QUEUES_KEY, ServerQueue, start_test_server
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
+    from aiohttp import web
 
-@pytest.fixture
-async def sse_server() -> AsyncIterator[tuple[ServerQueue, str]]:
+
+@pytest.fixture(scope="session")
+async def sse_app() -> AsyncIterator[tuple[web.Application, str]]:
     app, runner, port = await start_test_server()
-    yield ServerQueue(app[QUEUE_KEY]), f"http://127.0.0.1:{port}/events"
+    yield app, f"http://127.0.0.1:{port}/events"
     await runner.cleanup()
 
 
 @pytest.fixture
+def sse_server(
+    sse_app: tuple[web.Application, str],
+) -> tuple[ServerQueue, str]:
+    app, url = sse_app
+    queues = app[QUEUES_KEY]
+    name = str(len(queues))
+    queues[name] = asyncio.Queue()
+    return ServerQueue(queues[name]), f"{url}/{name}"
+
+
+@pytest.fixture(scope="session")
 def anyio_backend() -> str:
     return "asyncio"
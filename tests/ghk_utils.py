@@ -1,11 +1,39 @@
-from typing import cast
+import json
+from functools import cache
 
 from githubkit.webhooks import sign as ghk_sign
 from githubkit_schemas.latest.models import Repository, SimpleUser
 
 EX_URL = "https://example.com"
 
-DUMMY_USER = SimpleUser(
+_USER_URLS = dict.fromkeys(
+    (
+        f"{kind}_url" for kind in (
+            "avatar", "html", "followers", "following", "gists", "starred",
+            "subscriptions", "organizations", "repos", "events", "received_events",
+        )
+    ),
+    EX_URL,
+)  # fmt: skip
+
+_REPO_URLS = dict.fromkeys(
+    (
+        f"{kind}_url" for kind in (
+            "html", "archive", "assignees", "blobs", "branches", "collaborators",
+            "comments", "commits", "compare", "contents", "contributors",
+            "deployments", "downloads", "events", "forks",
+            "git_commits", "git_refs", "git_tags", "git", "issue_comment",
+            "issue_events", "issues", "keys", "labels", "languages", "merges",
+            "milestones", "notifications", "pulls", "releases", "ssh", "stargazers",
+            "statuses", "subscribers", "subscription", "tags", "teams", "trees",
+            "clone", "mirror", "hooks", "svn",
+        )
+    ),
+    EX_URL,
+)  # fmt: skip
+
+# The values are known to be valid, so skip validating them on every test run
+DUMMY_USER = SimpleUser.model_construct(
     login="dummy",
     id=0,
     node_id="0",
@@ -13,25 +41,17 @@ DUMMY_USER = SimpleUser(
     url=EX_URL,
     type="User",
     site_admin=False,
-    **dict.fromkeys(
-        (
-            f"{kind}_url" for kind in (
-                "avatar", "html", "followers", "following", "gists", "starred",
-                "subscriptions", "organizations", "repos", "events", "received_events",
-            )
-        ),
-        EX_URL,
-    ),
-).model_dump(mode="json")  # fmt: skip
+    **_USER_URLS,  # pyright: ignore[reportArgumentType]
+).model_dump(mode="json")
 
-DUMMY_REPO = Repository(
+DUMMY_REPO = Repository.model_construct(
     id=0,
     node_id="0",
     name="foo",
     full_name="dummy/foo",
     license=None,
     forks=0,
-    owner=cast("SimpleUser", DUMMY_USER),
+    owner=SimpleUser.model_construct(**DUMMY_USER),
     description=None,
     fork=False,
     url=EX_URL,
@@ -50,22 +70,8 @@ DUMMY_REPO = Repository(
     updated_at=None,
     open_issues=0,
     watchers=0,
-    **dict.fromkeys(  # pyright: ignore[reportArgumentType]
-        (
-            f"{kind}_url" for kind in (
-                "html", "archive", "assignees", "blobs", "branches", "collaborators",
-                "comments", "commits", "compare", "contents", "contributors",
-                "deployments", "downloads", "events", "forks",
-                "git_commits", "git_refs", "git_tags", "git", "issue_comment",
-                "issue_events", "issues", "keys", "labels", "languages", "merges",
-                "milestones", "notifications", "pulls", "releases", "ssh", "stargazers",
-                "statuses", "subscribers", "subscription", "tags", "teams", "trees",
-                "clone", "mirror", "hooks", "svn",
-            )
-        ),
-        EX_URL,
-    ),
-).model_dump(mode="json", exclude_unset=True)  # fmt: skip
+    **_REPO_URLS,  # pyright: ignore[reportArgumentType]
+).model_dump(mode="json", exclude_unset=True)
 
 DUMMY_AUTH_EVENT = {
     "X-GitHub-Event": "github_app_authorization",
@@ -82,6 +88,27 @@ DUMMY_STAR_EVENT = {
     },
 }
 
+DUMMY_STAR_DELETE_EVENT = {
+    "X-GitHub-Event": "star",
+    "body": {
+        "action": "deleted",
+        "repository": DUMMY_REPO,
+        "sender": DUMMY_USER,
+        "starred_at": None,
+    },
+}
+
+# Missing both the action and the sender's login
+DUMMY_BAD_AUTH_EVENT = {
+    "X-GitHub-Event": "github_app_authorization",
+    "body": {"sender": {k: v for k, v in DUMMY_USER.items() if k != "login"}},
+}
+
+# Pre-encoded once so that tests sending the events as-is don't re-serialize them
+DUMMY_AUTH_EVENT_JSON = json.dumps(DUMMY_AUTH_EVENT, separators=(",", ":")).encode()
+DUMMY_STAR_EVENT_JSON = json.dumps(DUMMY_STAR_EVENT, separators=(",", ":")).encode()
+
 
+@cache
 def sign_auth_event(secret: str) -> str:
     return ghk_sign(secret, DUMMY_AUTH_EVENT["body"])
@@ -3,11 +3,23 @@ from __future__ import annotations
 import asyncio
 import json
 from contextlib import suppress
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from aiohttp import web
 
-QUEUE_KEY = web.AppKey("queue", asyncio.Queue)
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Each test streams from its own queue so that connections left over from earlier
+# tests can't consume its events
+QUEUES_KEY = web.AppKey("queues", dict)
+
+# json.dumps() builds a new encoder for every call with non-default separators
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _encode_event(data: dict[str, Any] | bytes) -> bytes:
+    return data if isinstance(data, bytes) else _encode_json(data).encode()
 
 
 async def sse_handler(request: web.Request) -> web.StreamResponse:
@@ -22,20 +34,23 @@ async def sse_handler(request: web.Request) -> web.StreamResponse:
     )
     await resp.prepare(request)
 
-    queue = request.app[QUEUE_KEY]
+    queue = request.app[QUEUES_KEY][request.match_info["name"]]
     with suppress(asyncio.CancelledError):
-        while True:
-            if (msg := await queue.get()) is None:
+        while (msg := await queue.get()) is not None:
+            # Send everything that's already queued up in a single write
+            messages = [msg]
+            while not queue.empty() and (msg := queue.get_nowait()) is not None:
+                messages.append(msg)
+            await resp.write(b"".join(b"data: %b\n\n" % m for m in messages))
+            if msg is None:
                 break
-            data = f"data: {msg}\n\n"
-            await resp.write(data.encode())
     return resp
 
 
 async def start_test_server() -> tuple[web.Application, web.AppRunner, int]:
     app = web.Application()
-    app[QUEUE_KEY] = asyncio.Queue()
-    app.router.add_get("/events", sse_handler)
+    app[QUEUES_KEY] = {}
+    app.router.add_get("/events/{name}", sse_handler)
 
     runner = web.AppRunner(app)
     await runner.setup()
@@ -47,11 +62,15 @@ async def start_test_server() -> tuple[web.Application, web.AppRunner, int]:
 
 
 class ServerQueue:
-    def __init__(self, queue: asyncio.Queue[str | None]) -> None:
+    def __init__(self, queue: asyncio.Queue[bytes | None]) -> None:
         self._queue = queue
 
-    async def send_event(self, data: dict[str, Any]) -> None:
-        await self._queue.put(json.dumps(data, separators=(",", ":")))
+    def send_events(self, events: Iterable[dict[str, Any] | bytes]) -> None:
+        """Queue all `events` followed by the end signal in one go."""
+        # The queue is unbounded, so there's no need to yield to the loop for each put
+        for data in events:
+            self._queue.put_nowait(_encode_event(data))
+        self._queue.put_nowait(None)
 
     async def end_signal(self) -> None:
         await self._queue.put(None)
@@ -7,7 +7,7 @@ import pytest
 from monalisten import AuthIssue, AuthIssueKind, Monalisten, events
 from monalisten._core import EVENT_HEADER, SIG_HEADER
 
-from .ghk_utils import DUMMY_AUTH_EVENT, sign_auth_event
+from .ghk_utils import DUMMY_AUTH_EVENT, DUMMY_AUTH_EVENT_JSON, sign_auth_event
 
 if TYPE_CHECKING:
     from monalisten._errors import Error
@@ -17,9 +17,10 @@ if TYPE_CHECKING:
 
 async def test_no_token(sse_server: tuple[ServerQueue, str]) -> None:
     queue, url = sse_server
-    await queue.send_event(DUMMY_AUTH_EVENT)
-    await queue.send_event(DUMMY_AUTH_EVENT | {SIG_HEADER: "sha256=0"})
-    await queue.end_signal()
+    queue.send_events([
+        DUMMY_AUTH_EVENT_JSON,
+        DUMMY_AUTH_EVENT | {SIG_HEADER: "sha256=0"},
+    ])
 
     client = Monalisten(url)
     hooks_triggered = 0
@@ -40,11 +41,23 @@ async def test_no_token(sse_server: tuple[ServerQueue, str]) -> None:
     assert received_issues == [AuthIssueKind.UNEXPECTED]
 
 
+VALID_DIGEST = sign_auth_event("foobar").removeprefix("sha256=")
+SPACED_DIGEST = " ".join(VALID_DIGEST[i : i + 2] for i in range(0, 64, 2))
+
+
 @pytest.mark.parametrize(
     ("sig_header_entry", "expected_issues", "should_be_triggered"),
     [
         ({}, [AuthIssueKind.MISSING], False),
         ({SIG_HEADER: sign_auth_event("wrong")}, [AuthIssueKind.MISMATCH], False),
+        ({SIG_HEADER: "sha256=nothex"}, [AuthIssueKind.MISMATCH], False),
+        ({SIG_HEADER: "sha1=00"}, [AuthIssueKind.MISMATCH], False),
+        (
+            {SIG_HEADER: f"sha256={VALID_DIGEST.upper()}"},
+            [AuthIssueKind.MISMATCH],
+            False,
+        ),
+        ({SIG_HEADER: f"sha256= {SPACED_DIGEST}"}, [AuthIssueKind.MISMATCH], False),
         ({SIG_HEADER: sign_auth_event("foobar")}, [], True),
         ({SIG_HEADER.title(): sign_auth_event("foobar")}, [], True),
     ],
@@ -56,8 +69,7 @@ async def test_validation(
     should_be_triggered: bool,
 ) -> None:
     queue, url = sse_server
-    await queue.send_event(DUMMY_AUTH_EVENT | sig_header_entry)
-    await queue.end_signal()
+    queue.send_events([DUMMY_AUTH_EVENT | sig_header_entry])
 
     client = Monalisten(url, token="foobar")
     hook_triggered = False
@@ -82,8 +94,7 @@ async def test_validation(
 # headers but no `body` would crash the authentication check if a token was set.
 async def test_no_eager_body_access(sse_server: tuple[ServerQueue, str]) -> None:
     queue, url = sse_server
-    await queue.send_event({SIG_HEADER: "foo", EVENT_HEADER: "bar"})
-    await queue.end_signal()
+    queue.send_events([{SIG_HEADER: "foo", EVENT_HEADER: "bar"}])
 
     client = Monalisten(url, token="foo")
     error_captured = False
@@ -53,3 +53,24 @@ async def test_auth(
         PermissionError, check=lambda exc: exc.args[0].kind is expected_kind
     ):
         await client.dispatch_event("star", {"action": "created"}, headers=headers)
+
+
+async def test_late_registration() -> None:
+    client = Monalisten("bobr://bob.er/")
+    trigger_count = 0
+
+    @client.event.star
+    async def _(_: events.Star) -> None:
+        nonlocal trigger_count
+        trigger_count += 1
+
+    await client.dispatch_event("star", DUMMY_STAR_EVENT["body"])
+
+    @client.event.star.created
+    async def _(_: events.StarCreated) -> None:
+        nonlocal trigger_count
+        trigger_count += 10
+
+    await client.dispatch_event("star", DUMMY_STAR_EVENT["body"])
+
+    assert trigger_count == 12
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-import copy
+import asyncio
 from typing import TYPE_CHECKING
 
-from monalisten import Monalisten, events
-from tests.ghk_utils import DUMMY_AUTH_EVENT, DUMMY_STAR_EVENT
+import pytest
+
+from monalisten import Monalisten, MonalistenSetupError, events
+from tests.ghk_utils import (
+    DUMMY_AUTH_EVENT_JSON,
+    DUMMY_STAR_DELETE_EVENT,
+    DUMMY_STAR_EVENT_JSON,
+)
 
 if TYPE_CHECKING:
     from .sse_server import ServerQueue
@@ -12,9 +18,7 @@ if TYPE_CHECKING:
 
 async def test_regular_scenario(sse_server: tuple[ServerQueue, str]) -> None:
     queue, url = sse_server
-    await queue.send_event(DUMMY_AUTH_EVENT)
-    await queue.send_event(DUMMY_STAR_EVENT)
-    await queue.end_signal()
+    queue.send_events([DUMMY_AUTH_EVENT_JSON, DUMMY_STAR_EVENT_JSON])
 
     hooks_triggered = [False, False]
     client = Monalisten(url)
@@ -34,8 +38,7 @@ async def test_regular_scenario(sse_server: tuple[ServerQueue, str]) -> None:
 
 async def test_one_event_multiple_hooks(sse_server: tuple[ServerQueue, str]) -> None:
     queue, url = sse_server
-    await queue.send_event(DUMMY_STAR_EVENT)
-    await queue.end_signal()
+    queue.send_events([DUMMY_STAR_EVENT_JSON])
 
     hooks_triggered = [False, False]
     client = Monalisten(url)
@@ -55,9 +58,7 @@ async def test_one_event_multiple_hooks(sse_server: tuple[ServerQueue, str]) ->
 
 async def test_multiple_events_one_hook(sse_server: tuple[ServerQueue, str]) -> None:
     queue, url = sse_server
-    await queue.send_event(DUMMY_STAR_EVENT)
-    await queue.send_event(DUMMY_AUTH_EVENT)
-    await queue.end_signal()
+    queue.send_events([DUMMY_STAR_EVENT_JSON, DUMMY_AUTH_EVENT_JSON])
 
     trigger_count = 0
     client = Monalisten(url)
@@ -75,9 +76,7 @@ async def test_multiple_events_one_hook(sse_server: tuple[ServerQueue, str]) ->
 
 async def test_wildcard_hook(sse_server: tuple[ServerQueue, str]) -> None:
     queue, url = sse_server
-    await queue.send_event(DUMMY_STAR_EVENT)
-    await queue.send_event(DUMMY_AUTH_EVENT)
-    await queue.end_signal()
+    queue.send_events([DUMMY_STAR_EVENT_JSON, DUMMY_AUTH_EVENT_JSON])
 
     trigger_count = 0
     client = Monalisten(url)
@@ -96,11 +95,7 @@ async def test_wildcard_hook(sse_server: tuple[ServerQueue, str]) -> None:
 
 async def test_subhooks(sse_server: tuple[ServerQueue, str]) -> None:
     queue, url = sse_server
-    dummy_star_delete_event = copy.deepcopy(DUMMY_STAR_EVENT)
-    dummy_star_delete_event["body"] |= {"action": "deleted", "starred_at": None}
-    await queue.send_event(DUMMY_STAR_EVENT)
-    await queue.send_event(dummy_star_delete_event)
-    await queue.end_signal()
+    queue.send_events([DUMMY_STAR_EVENT_JSON, DUMMY_STAR_DELETE_EVENT])
 
     event_sum = 0
     client = Monalisten(url)
@@ -128,3 +123,29 @@ async def test_subhooks(sse_server: tuple[ServerQueue, str]) -> None:
     await client.listen()
 
     assert event_sum == 1122
+
+
+async def test_concurrent_handling(sse_server: tuple[ServerQueue, str]) -> None:
+    queue, url = sse_server
+    queue.send_events([DUMMY_STAR_EVENT_JSON, DUMMY_AUTH_EVENT_JSON])
+
+    client = Monalisten(url, concurrency=2)
+    auth_handled = asyncio.Event()
+
+    @client.event.star
+    async def _(_: events.Star) -> None:
+        # Only finishes if the next event is handled while this one is in progress
+        await asyncio.wait_for(auth_handled.wait(), timeout=5)
+
+    @client.event.github_app_authorization
+    async def _(_: events.GithubAppAuthorization) -> None:
+        auth_handled.set()
+
+    await client.listen()
+
+    assert auth_handled.is_set()
+
+
+def test_invalid_concurrency() -> None:
+    with pytest.raises(MonalistenSetupError, match="concurrency must be at least 1"):
+        Monalisten("bobr://bob.er/", concurrency=0)
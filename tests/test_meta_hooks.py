@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 import sys
 import textwrap
 from contextlib import nullcontext
@@ -17,9 +16,16 @@ from monalisten import (
     events,
 )
 from monalisten._core import EVENT_HEADER, SIG_HEADER
-from tests.ghk_utils import DUMMY_AUTH_EVENT, sign_auth_event
+from tests.ghk_utils import (
+    DUMMY_AUTH_EVENT,
+    DUMMY_AUTH_EVENT_JSON,
+    DUMMY_BAD_AUTH_EVENT,
+    sign_auth_event,
+)
 
 if TYPE_CHECKING:
+    from monalisten import EventPayload
+
     from .sse_server import ServerQueue
 
 
@@ -41,15 +47,16 @@ async def test_on_ready(
 
     await client.listen()
 
-    printed_messages = capsys.readouterr().out.split()
+    printed_messages = capsys.readouterr().out.splitlines()
     assert sorted(printed_messages) == ["hello", "there"]
 
 
 async def test_on_auth_issue(sse_server: tuple[ServerQueue, str]) -> None:
     queue, url = sse_server
-    await queue.send_event(DUMMY_AUTH_EVENT)
-    await queue.send_event(DUMMY_AUTH_EVENT | {SIG_HEADER: sign_auth_event("wrong")})
-    await queue.end_signal()
+    queue.send_events([
+        DUMMY_AUTH_EVENT_JSON,
+        DUMMY_AUTH_EVENT | {SIG_HEADER: sign_auth_event("wrong")},
+    ])
 
     client = Monalisten(url, token="foobar")
     issue_names: list[str] = []
@@ -63,19 +70,38 @@ async def test_on_auth_issue(sse_server: tuple[ServerQueue, str]) -> None:
     assert sorted(issue_names) == ["mismatch", "missing"]
 
 
-@pytest.mark.parametrize(
-    ("event", "err_msg"),
-    [
-        ({"foo": "bar"}, f"received data is missing the {EVENT_HEADER} header"),
-        ({EVENT_HEADER: "push"}, "received data doesn't contain a body"),
-    ],
+async def test_on_payload(sse_server: tuple[ServerQueue, str]) -> None:
+    queue, url = sse_server
+    # Not a valid push event, but it never gets parsed without a push hook
+    queue.send_events([
+        {EVENT_HEADER: "push", "body": {"foo": "bar"}},
+        DUMMY_AUTH_EVENT_JSON,
+    ])
+
+    client = Monalisten(url)
+    received_events: list[str] = []
+
+    @client.internal.payload
+    async def _(payload: EventPayload) -> None:
+        received_events.append(payload[EVENT_HEADER])
+
+    await client.listen()
+
+    assert received_events == ["push", "github_app_authorization"]
+
+
+MISSING_DATA_CASES = (
+    ({"foo": "bar"}, f"received data is missing the {EVENT_HEADER} header"),
+    ({EVENT_HEADER: "push"}, "received data doesn't contain a body"),
 )
+
+
+@pytest.mark.parametrize(("event", "err_msg"), MISSING_DATA_CASES)
 async def test_no_error_hook(
     sse_server: tuple[ServerQueue, str], event: dict[str, Any], err_msg: str
 ) -> None:
     queue, url = sse_server
-    await queue.send_event(event)
-    await queue.end_signal()
+    queue.send_events([event])
 
     client = Monalisten(url)
 
@@ -87,8 +113,7 @@ async def test_no_error_hook_no_preprocessing_trigger_on_unused_event(
     sse_server: tuple[ServerQueue, str],
 ) -> None:
     queue, url = sse_server
-    await queue.send_event({EVENT_HEADER: "push", "body": {"foo": "bar"}})
-    await queue.end_signal()
+    queue.send_events([{EVENT_HEADER: "push", "body": {"foo": "bar"}}])
 
     client = Monalisten(url)
 
@@ -99,8 +124,7 @@ async def test_no_error_hook_preprocessing_trigger_on_used_event(
     sse_server: tuple[ServerQueue, str],
 ) -> None:
     queue, url = sse_server
-    await queue.send_event({EVENT_HEADER: "push", "body": {"foo": "bar"}})
-    await queue.end_signal()
+    queue.send_events([{EVENT_HEADER: "push", "body": {"foo": "bar"}}])
 
     client = Monalisten(url)
 
@@ -118,8 +142,7 @@ async def test_no_error_hook_preprocessing_trigger_on_used_event(
 @pytest.mark.parametrize(
     ("event", "err_msg"),
     [
-        ({"foo": "bar"}, f"received data is missing the {EVENT_HEADER} header"),
-        ({EVENT_HEADER: "push"}, "received data doesn't contain a body"),
+        *MISSING_DATA_CASES,
         (
             {EVENT_HEADER: "push", "body": {"foo": "bar"}},
             "the received payload could not be parsed as an event",
@@ -130,8 +153,7 @@ async def test_on_error_preprocessing(
     sse_server: tuple[ServerQueue, str], event: dict[str, Any], err_msg: str
 ) -> None:
     queue, url = sse_server
-    await queue.send_event(event)
-    await queue.end_signal()
+    queue.send_events([event])
 
     client = Monalisten(url)
 
@@ -144,17 +166,45 @@ async def test_on_error_preprocessing(
     await client.listen()
 
 
+async def test_on_error_unknown_event() -> None:
+    client = Monalisten("bobr://bob.er/")
+    errors: list[Error] = []
+
+    @client.event.any
+    async def _(_: events.Any) -> None:
+        pass
+
+    @client.internal.error
+    async def _(error: Error) -> None:
+        errors.append(error)
+
+    await client.dispatch_event("foo", {"bar": "baz"})
+
+    assert len(errors) == 1
+    assert isinstance(errors[0].exc, MonalistenPreprocessingError)
+    assert str(errors[0].exc) == "received an unknown event: 'foo'"
+
+
+async def test_unknown_event_without_typed_hooks() -> None:
+    client = Monalisten("bobr://bob.er/")
+    received_events: list[str] = []
+
+    @client.internal.payload
+    async def _(payload: EventPayload) -> None:
+        received_events.append(payload[EVENT_HEADER])
+
+    # Raw payload hooks don't depend on the event being in the known schema
+    await client.dispatch_event("foo", {"bar": "baz"})
+
+    assert received_events == ["foo"]
+
+
 async def test_handling_pydantic_errors(
     sse_server: tuple[ServerQueue, str],
     capsys: pytest.CaptureFixture[str],
 ) -> None:
     queue, url = sse_server
-    bad_event = copy.deepcopy(DUMMY_AUTH_EVENT)
-    del bad_event["body"]["sender"]["login"]
-    del bad_event["body"]["action"]
-
-    await queue.send_event(bad_event)
-    await queue.end_signal()
+    queue.send_events([DUMMY_BAD_AUTH_EVENT])
 
     client = Monalisten(url)
 
@@ -186,8 +236,7 @@ async def test_handling_pydantic_errors(
 
 async def test_on_error_processing(sse_server: tuple[ServerQueue, str]) -> None:
     queue, url = sse_server
-    await queue.send_event({EVENT_HEADER: "bar", "body": {"foo": "bar"}})
-    await queue.end_signal()
+    queue.send_events([{EVENT_HEADER: "bar", "body": {"foo": "bar"}}])
 
     client = Monalisten(url, token="foobar")
 
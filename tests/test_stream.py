@@ -1,23 +1,26 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any
 
+import httpx
 import pytest
+from httpx_sse import ServerSentEvent
 
 from monalisten import Monalisten
 
 if TYPE_CHECKING:
-    from monalisten._errors import EventPayload
+    from collections.abc import AsyncIterator, Callable
+
+    from monalisten import EventPayload
 
     from .sse_server import ServerQueue
 
 
 async def test_core_streaming(sse_server: tuple[ServerQueue, str]) -> None:
     queue, url = sse_server
-    await queue.send_event({"foo": "bar"})
-    await queue.send_event({})
-    await queue.send_event({"baz": "qux"})
-    await queue.end_signal()
+    queue.send_events([{"foo": "bar"}, {}, {"baz": "qux"}])
 
     client = Monalisten(url)
     received_events: list[EventPayload] = []
@@ -37,13 +40,143 @@ async def test_core_streaming(sse_server: tuple[ServerQueue, str]) -> None:
     assert received_events[1] == {"baz": "qux"}
 
 
-@pytest.mark.parametrize("payload", ["{}", "{ }"])
+@pytest.mark.parametrize("payload", [b"", b"{}", b"{ }"])
 async def test_ignore_no_data(
-    sse_server: tuple[ServerQueue, str], payload: str
+    sse_server: tuple[ServerQueue, str], payload: bytes
 ) -> None:
     queue, url = sse_server
-    await queue._queue.put(payload)
-    await queue.end_signal()
+    queue.send_events([payload])
 
     client = Monalisten(url)
     await client.listen()
+
+
+async def test_custom_http_client(sse_server: tuple[ServerQueue, str]) -> None:
+    queue, url = sse_server
+    queue.send_events([{"foo": "bar"}])
+
+    requested_urls: list[str] = []
+
+    async def log_request(request: httpx.Request) -> None:
+        requested_urls.append(str(request.url))
+
+    async with httpx.AsyncClient(
+        timeout=None, event_hooks={"request": [log_request]}
+    ) as http_client:
+        client = Monalisten(url, http_client=http_client)
+        received_events: list[EventPayload] = []
+
+        async def spoofed_handle_payload(
+            payload: EventPayload, *, skip_auth: bool = False
+        ) -> None:
+            _ = skip_auth
+            received_events.append(payload)
+
+        client._handle_payload = spoofed_handle_payload
+
+        await client.listen()
+
+        assert not http_client.is_closed
+
+    assert requested_urls == [url]
+    assert received_events == [{"foo": "bar"}]
+
+
+async def test_custom_http_client_default_timeouts(
+    sse_server: tuple[ServerQueue, str],
+) -> None:
+    queue, url = sse_server
+    queue.send_events([])
+
+    request_timeouts: list[dict[str, float | None]] = []
+
+    async def log_request(request: httpx.Request) -> None:
+        request_timeouts.append(request.extensions["timeout"])
+
+    async with httpx.AsyncClient(event_hooks={"request": [log_request]}) as http_client:
+        client = Monalisten(url, http_client=http_client)
+        await client.listen()
+
+    # Only the read timeout is lifted for the stream
+    assert request_timeouts == [
+        {"connect": 5.0, "read": None, "write": 5.0, "pool": 5.0}
+    ]
+
+
+async def test_custom_http_client_idle_stream(
+    sse_server: tuple[ServerQueue, str],
+) -> None:
+    queue, url = sse_server
+    # Stays idle for longer than the client's read timeout
+    asyncio.get_running_loop().call_later(0.3, queue.send_events, [{"foo": "bar"}])
+
+    async with httpx.AsyncClient(timeout=0.1) as http_client:
+        client = Monalisten(url, http_client=http_client)
+        received_events: list[EventPayload] = []
+
+        async def spoofed_handle_payload(
+            payload: EventPayload, *, skip_auth: bool = False
+        ) -> None:
+            _ = skip_auth
+            received_events.append(payload)
+
+        client._handle_payload = spoofed_handle_payload
+
+        await client.listen()
+
+    assert received_events == [{"foo": "bar"}]
+
+
+def fake_sse_stream(
+    *payloads: dict[str, Any], error: Exception | None = None
+) -> Callable[..., AsyncIterator[ServerSentEvent]]:
+    async def aiter_sse(*_: object) -> AsyncIterator[ServerSentEvent]:
+        for payload in payloads:
+            yield ServerSentEvent(data=json.dumps(payload))
+        if error:
+            raise error
+
+    return aiter_sse
+
+
+async def test_cancelled_hook(monkeypatch: pytest.MonkeyPatch) -> None:
+    # More events than the queue holds, so that the stream is left waiting on it
+    stream = fake_sse_stream({"foo": "bar"}, {"foo": "baz"}, {"foo": "qux"})
+    monkeypatch.setattr("monalisten._core.aiter_sse_retrying", stream)
+
+    client = Monalisten("http://127.0.0.1/events")
+
+    async def spoofed_handle_payload(
+        payload: EventPayload, *, skip_auth: bool = False
+    ) -> None:
+        _ = payload, skip_auth
+        raise asyncio.CancelledError
+
+    client._handle_payload = spoofed_handle_payload
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(client.listen(), timeout=5)
+
+
+async def test_stream_error_after_event(monkeypatch: pytest.MonkeyPatch) -> None:
+    error = httpx.RemoteProtocolError("peer closed connection")
+    stream = fake_sse_stream({"foo": "bar"}, error=error)
+    monkeypatch.setattr("monalisten._core.aiter_sse_retrying", stream)
+
+    client = Monalisten("http://127.0.0.1/events")
+    handled_events: list[EventPayload] = []
+
+    async def spoofed_handle_payload(
+        payload: EventPayload, *, skip_auth: bool = False
+    ) -> None:
+        _ = skip_auth
+        await asyncio.sleep(0.05)
+        handled_events.append(payload)
+
+    client._handle_payload = spoofed_handle_payload
+
+    # The event read before the error is still handled in full
+    with pytest.raises(httpx.RemoteProtocolError):
+        await client.listen()
+
+    assert handled_events == [{"foo": "bar"}]